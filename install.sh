@@ -31,7 +31,7 @@ if [ ! -d "$APP_DIR/venv" ] || [ "$FORCE" = true ]; then
     cd "$APP_DIR"
     python3 -m venv venv
     source venv/bin/activate
-    pip install PyQt6 --quiet
+    pip install PyQt6 orjson jeepney --quiet
 else
     echo ">>> Virtual Environment exists. Skipping setup (use --force to reinstall venv)."
 fi
@@ -4,12 +4,25 @@ import subprocess
 import os
 import shutil
 import argparse
+import time
+import functools
 from PyQt6.QtWidgets import (QApplication, QSystemTrayIcon, QMenu, QDialog,
                              QVBoxLayout, QHBoxLayout, QLabel, QListWidget,
                              QPushButton, QSpinBox, QLineEdit, QScrollArea,
                              QWidget, QFrame, QSplitter, QCheckBox, QInputDialog, QMessageBox)
 from PyQt6.QtGui import QIcon, QAction, QColor, QPalette
-from PyQt6.QtCore import QTimer, Qt
+from PyQt6.QtCore import QTimer, QThreadPool, Qt
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import jeepney
+    from jeepney.io.blocking import open_dbus_connection
+except ImportError:
+    jeepney = None
 
 # --- Constants ---
 APP_NAME = "LuxWatch"
@@ -20,29 +33,59 @@ CONFIG_FILE = os.path.expanduser("~/.config/luxwatch_config.json")
 ICON_ACTIVE = os.path.join(BASE_DIR, "tray_active.svg")
 ICON_INACTIVE = os.path.join(BASE_DIR, "tray_inactive.svg")
 
+# Process scan interval: fast right after a state change, backing off while stable
+POLL_INTERVAL_FAST_MS = 2000
+POLL_INTERVAL_IDLE_MS = 30000
+
+# Monitors rarely hot-plug, so reuse the kscreen-doctor query for a while
+MONITOR_CACHE_TTL = 30
+
+# libkscreen's backend service, the same one kscreen-doctor talks to
+KSCREEN_BACKEND = None if jeepney is None else jeepney.DBusAddress(
+    "/backend", bus_name="org.kde.KScreen", interface="org.kde.kscreen.Backend")
+
+# Bursts of GUI edits are coalesced into one config write after this delay
+SAVE_DEBOUNCE_MS = 200
+
 # Wrappers that we allow deep scanning for
-SAFE_WRAPPERS = [
+SAFE_WRAPPERS = frozenset([
     "bwrap", "flatpak", "distrobox", "distrobox-enter",
     "pressure-vessel-adverb", "steam", "python", "python3", "sh", "bash",
     "gamescope", "mangoapp", "mangohud" # Added gamescope as it wraps other apps too
-]
+])
 
 # Paths that frequently appear in bwrap args but are NOT the app itself
-IGNORE_PREFIXES = [
+IGNORE_PREFIXES = (
     "/var/lib/flatpak",
     "/usr/lib/extensions",
     "/run/flatpak"
-]
+)
 
 # --- Backend Logic ---
 
+@functools.lru_cache(maxsize=4096)
+def exe_key(path):
+    # The same few hundred exe paths repeat every scan, so memoize the normalization
+    # os.path.basename handles '/usr/bin/gamescope' -> 'gamescope'
+    return os.path.basename(path).lower()
+
 class ConfigManager:
     def __init__(self):
+        # Writes happen on a single background thread so they stay in order
+        self.save_pool = QThreadPool()
+        self.save_pool.setMaxThreadCount(1)
+        self.save_timer = QTimer()
+        self.save_timer.setSingleShot(True)
+        self.save_timer.timeout.connect(self.flush_save)
+
         self.data = self.load_config()
+        self.rebuild_trigger_index()
+        self.resolve_monitor_levels()
 
     def load_config(self):
         defaults = {
             "config_version": CONFIG_VERSION,
+            "poll_interval_idle_ms": POLL_INTERVAL_IDLE_MS,
             "desktop_profile": { "monitors": {} },
             "game_profiles": []
         }
@@ -51,29 +94,43 @@ class ConfigManager:
             return defaults
 
         try:
-            with open(CONFIG_FILE, 'r') as f:
-                data = json.load(f)
+            with open(CONFIG_FILE, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson else json.loads(raw)
 
             file_version = data.get("config_version", 0)
 
             if file_version < CONFIG_VERSION:
                 print(f"Migrating config from v{file_version} to v{CONFIG_VERSION}...")
-                shutil.copy(CONFIG_FILE, CONFIG_FILE + ".bak")
-
-                if file_version == 0:
-                    if "profiles" in data and "desktop_profile" not in data:
-                        return self.migrate_wip_to_v1(data)
-                    if "desktop_profile" in data:
-                        data["config_version"] = 1
-                        return data
-                    if "games" in data:
-                         return self.migrate_alpha_to_v1(data)
+                # One backup per source version: every migration is backed up, and an
+                # interrupted retry never overwrites the original copy of that version
+                backup_file = CONFIG_FILE + f".v{file_version}.bak"
+                if not os.path.exists(backup_file):
+                    shutil.copy(CONFIG_FILE, backup_file)
+
+                data = self.migrate(data, file_version)
+                # Persist right away so the migration (and backup) only ever run once
+                self.data = data
+                self.save_config()
             return data
 
         except Exception as e:
             print(f"Config load error: {e}")
             return defaults
 
+    def migrate(self, data, file_version):
+        if file_version == 0:
+            if "profiles" in data and "desktop_profile" not in data:
+                data = self.migrate_wip_to_v1(data)
+            elif "games" in data and "desktop_profile" not in data:
+                data = self.migrate_alpha_to_v1(data)
+
+        # Every path ends up current, even layouts we don't recognise
+        data.setdefault("desktop_profile", { "monitors": {} })
+        data.setdefault("game_profiles", [])
+        data["config_version"] = CONFIG_VERSION
+        return data
+
     def migrate_wip_to_v1(self, old_data):
         desktop_mons = {}
         game_profiles = []
@@ -122,9 +179,72 @@ class ConfigManager:
         }
 
     def save_config(self):
+        # The in-memory state takes effect immediately; the disk write is debounced
         self.data["config_version"] = CONFIG_VERSION
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(self.data, f, indent=4)
+        self.rebuild_trigger_index()
+        self.resolve_monitor_levels()
+        self.save_timer.start(SAVE_DEBOUNCE_MS)
+
+    def flush_save(self):
+        # Serialize on the GUI thread so the worker never sees a half-edited dict
+        if orjson:
+            payload = orjson.dumps(self.data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(self.data, indent=4).encode("utf-8")
+        self.save_pool.start(lambda: self.write_config(payload))
+
+    def flush_pending(self):
+        # Called on quit: push out a debounced save and wait for the writer
+        if self.save_timer.isActive():
+            self.save_timer.stop()
+            self.flush_save()
+        self.save_pool.waitForDone()
+
+    def write_config(self, payload):
+        # Write to a temp file and rename, so a crash never leaves a truncated config
+        tmp_file = CONFIG_FILE + ".tmp"
+        try:
+            with open(tmp_file, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_file, CONFIG_FILE)
+        except OSError as e:
+            print(f"Config save error: {e}")
+
+    def rebuild_trigger_index(self):
+        # Flat {trigger_lower: (profile_index, profile)} map so the scanner does one lookup
+        # per token. The index lets the scanner prefer earlier profiles, and setdefault keeps
+        # the first profile when several list the same trigger.
+        self._trigger_index = {}
+        # Runs at startup outside any try, so skip anything a hand edit got wrong
+        for index, profile in enumerate(self.data.get("game_profiles", [])):
+            for trigger in profile.get("triggers", []):
+                if not isinstance(trigger, str): continue
+                self._trigger_index.setdefault(trigger.lower(), (index, profile))
+
+    def get_trigger_index(self):
+        return self._trigger_index
+
+    def resolve_monitor_levels(self):
+        # Flatten each game profile to {monitor: level} once, so a switch just reads it.
+        # Kept beside the config (keyed by profile object) so it never gets saved to disk.
+        self._monitor_levels = {}
+        for profile in self.data.get("game_profiles", []):
+            self._monitor_levels[id(profile)] = self.resolve_profile_levels(profile)
+
+    def resolve_profile_levels(self, profile):
+        levels = {}
+        for mon, m_conf in profile.get("monitors", {}).items():
+            # Tolerate a bare legacy level ("DP-1": 50) as well as the {brightness, enabled} form
+            if not isinstance(m_conf, dict):
+                m_conf = {"brightness": m_conf}
+            levels[mon] = m_conf.get("brightness", 100) if m_conf.get("enabled", True) else 0
+        return levels
+
+    def get_monitor_levels(self, profile):
+        levels = self._monitor_levels.get(id(profile))
+        if levels is None:
+            levels = self.resolve_profile_levels(profile)
+        return levels
 
     def get_desktop_settings(self):
         return self.data["desktop_profile"]
@@ -132,6 +252,14 @@ class ConfigManager:
     def get_game_profiles(self):
         return self.data["game_profiles"]
 
+    def get_poll_interval_idle(self):
+        # Hand-edited value: fall back on garbage, and never poll faster than the fast rate
+        try:
+            idle_ms = int(self.data.get("poll_interval_idle_ms", POLL_INTERVAL_IDLE_MS))
+        except (TypeError, ValueError):
+            idle_ms = POLL_INTERVAL_IDLE_MS
+        return max(idle_ms, POLL_INTERVAL_FAST_MS)
+
     def add_profile(self, name):
         new_profile = {
             "name": name,
@@ -154,9 +282,14 @@ class LuxWatch(QSystemTrayIcon):
         self.app = app
         self.debug = debug
         self.cfg_manager = ConfigManager()
+        self.app.aboutToQuit.connect(self.cfg_manager.flush_pending)
 
         self.current_state = "unknown"
         self.active_profile_name = None
+        self.active_pid = None
+        self.active_exe = None
+        self.monitor_cache = (0.0, None)
+        self.dbus_conn = None
 
         self.update_tray_icon("desktop")
 
@@ -167,7 +300,7 @@ class LuxWatch(QSystemTrayIcon):
 
         self.timer = QTimer()
         self.timer.timeout.connect(self.check_processes)
-        self.timer.start(3000)
+        self.timer.start(POLL_INTERVAL_FAST_MS)
 
         self.show()
         print(f"{APP_NAME} v{APP_VERSION} started. Debug: {self.debug}")
@@ -183,29 +316,61 @@ class LuxWatch(QSystemTrayIcon):
         if self.debug:
             print(f"[DEBUG] {message}", flush=True)
 
-    def get_connected_monitors(self):
+    def invalidate_monitor_cache(self):
+        self.monitor_cache = (0.0, None)
+
+    def query_monitors_dbus(self):
         monitors = []
         try:
-            output = subprocess.check_output(["kscreen-doctor", "-j"]).decode("utf-8")
-            data = json.loads(output)
-            if "outputs" in data:
-                for out in data["outputs"]:
-                    if out.get("connected", False):
-                        name = out.get("name")
-                        if name: monitors.append(name)
-        except Exception:
+            if self.dbus_conn is None:
+                self.dbus_conn = open_dbus_connection(bus="SESSION")
+            reply = self.dbus_conn.send_and_get_reply(
+                jeepney.new_method_call(KSCREEN_BACKEND, "getConfig"), timeout=2)
+            config = reply.body[0]
+
+            # jeepney hands back variants as (signature, value) pairs
+            for _, out in config["outputs"][1]:
+                if out["connected"][1] and out["name"][1]: monitors.append(out["name"][1])
+        except Exception as e:
+            self.log(f"KScreen DBus query failed: {e}")
+            if self.dbus_conn is not None:
+                self.dbus_conn.close()
+                self.dbus_conn = None
+            return []
+        return monitors
+
+    def get_connected_monitors(self):
+        cached_at, cached = self.monitor_cache
+        if cached is not None and time.monotonic() - cached_at < MONITOR_CACHE_TTL:
+            return cached
+
+        # Ask the KScreen backend over DBus first; kscreen-doctor is the fallback
+        monitors = self.query_monitors_dbus() if jeepney else []
+        if not monitors:
             try:
-                output = subprocess.check_output(["kscreen-doctor", "-o"]).decode("utf-8")
-                for line in output.splitlines():
-                    if "Output:" in line and "connected" in line:
-                        parts = line.split()
-                        if len(parts) >= 3: monitors.append(parts[2])
-            except: pass
+                output = subprocess.check_output(["kscreen-doctor", "-j"], text=True, errors="replace")
+                data = orjson.loads(output) if orjson else json.loads(output)
+                for out in data.get("outputs", ()):
+                    # Fixed kscreen schema: index directly, skip the odd output missing a key
+                    try:
+                        if out["connected"] and out["name"]: monitors.append(out["name"])
+                    except KeyError:
+                        pass
+            except Exception:
+                try:
+                    output = subprocess.check_output(["kscreen-doctor", "-o"], text=True, errors="replace")
+                    for line in output.splitlines():
+                        if "Output:" in line and "connected" in line:
+                            parts = line.split()
+                            if len(parts) >= 3: monitors.append(parts[2])
+                except: pass
 
         if not monitors:
             monitors = ["HDMI-A-1", "DP-1", "DP-2", "DP-3"]
 
-        return sorted(monitors)
+        monitors = sorted(monitors)
+        self.monitor_cache = (time.monotonic(), monitors)
+        return monitors
 
     def setup_menu(self):
         menu = QMenu()
@@ -222,67 +387,130 @@ class LuxWatch(QSystemTrayIcon):
         self.settings_window.refresh_all()
         self.settings_window.show()
 
-    def set_brightness(self, monitor_id, level):
+    def set_brightness_bulk(self, levels):
+        # kscreen-doctor accepts several output settings at once, so one call covers every monitor
+        if not levels: return
         try:
-            level = max(0, min(100, int(level)))
-            cmd = ["kscreen-doctor", f"output.{monitor_id}.brightness.{level}"]
+            cmd = ["kscreen-doctor"]
+            for monitor_id, level in levels.items():
+                level = max(0, min(100, int(level)))
+                cmd.append(f"output.{monitor_id}.brightness.{level}")
             subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         except Exception as e:
             self.log(f"Failed to set brightness: {e}")
 
     def check_processes(self):
+        previous = (self.current_state, self.active_profile_name)
+        self.scan_processes()
+        self.update_poll_interval(previous != (self.current_state, self.active_profile_name))
+
+    def update_poll_interval(self, changed):
+        # Poll fast around launches/exits, then back off geometrically while the desktop is idle.
+        # In game state a tick is a single /proc/<pid> check, so stay fast to restore the desktop promptly.
+        idle_ms = self.cfg_manager.get_poll_interval_idle()
+        if changed or self.current_state == "game":
+            interval = POLL_INTERVAL_FAST_MS
+        else:
+            interval = min(self.timer.interval() * 2, idle_ms)
+
+        if interval != self.timer.interval():
+            self.log(f"\nPoll interval: {interval} ms")
+            self.timer.setInterval(interval)
+
+    def read_cmdlines(self):
+        # Read every command line straight from procfs instead of forking 'ps'.
+        # cmdline is NUL-separated, so argv arrives already tokenized.
+        # Each process is normalized once here into (pid, exe_name, wrapped_args);
+        # wrapped_args holds (token, basename_lower) pairs and is only built for SAFE_WRAPPERS.
+        procs = []
+        for pid in os.listdir("/proc"):
+            if not pid[0].isdigit(): continue
+            try:
+                with open(f"/proc/{pid}/cmdline", "rb") as f:
+                    raw = f.read()
+            except OSError:
+                continue # Process exited mid-scan
+
+            # Argv (e.g. [b'/usr/bin/python', b'myscript.py']); kernel threads have none
+            argv = [t for t in raw.split(b"\x00") if t]
+            if not argv: continue
+
+            # 0. Identify the "Main Executable" (First token)
+            exe_name = exe_key(argv[0].decode("utf-8", "replace"))
+
+            wrapped_args = None
+            if exe_name in SAFE_WRAPPERS:
+                wrapped_args = []
+                for t in argv[1:]:
+                    token = t.decode("utf-8", "replace")
+                    wrapped_args.append((token, exe_key(token)))
+
+            procs.append((int(pid), exe_name, wrapped_args))
+        return procs
+
+    def is_active_pid_alive(self):
+        # A zombie keeps /proc/<pid> but has an empty cmdline, and a reused PID runs
+        # a different exe, so compare argv[0] with what we matched
+        try:
+            with open(f"/proc/{self.active_pid}/cmdline", "rb") as f:
+                argv0 = f.read().split(b"\x00", 1)[0]
+        except OSError:
+            return False
+        return bool(argv0) and exe_key(argv0.decode("utf-8", "replace")) == self.active_exe
+
+    def scan_processes(self):
         if self.debug: print(".", end="", flush=True)
 
+        # Fast path: while the matched game is alive there is nothing to rescan
+        if self.active_pid and self.is_active_pid_alive():
+            return
+        self.active_pid = None
+
         try:
-            # Atomic Call: Get ONLY args (full command line) for all processes
-            # This avoids the race condition of calling 'comm' then 'args'
-            out_args = subprocess.check_output(["ps", "-A", "-o", "args="]).decode("utf-8").splitlines()
+            trigger_index = self.cfg_manager.get_trigger_index()
+            # No triggers configured (e.g. fresh install): nothing to look for, skip the walk
+            procs = self.read_cmdlines() if trigger_index else []
 
+            found_rank = None
             found_profile = None
+            found_pid = None
+            found_exe = None
             trigger_app = None
 
-            for profile in self.cfg_manager.get_game_profiles():
-                for trigger in profile["triggers"]:
-                    trigger_lower = trigger.lower()
-
-                    for full_args in out_args:
-                        full_args = full_args.strip()
-                        if not full_args: continue
-
-                        # Split into tokens (e.g. ['/usr/bin/python', 'myscript.py'])
-                        tokens = full_args.split()
-                        if not tokens: continue
-
-                        # 0. Identify the "Main Executable" (First token)
-                        # os.path.basename handles '/usr/bin/gamescope' -> 'gamescope'
-                        exe_name = os.path.basename(tokens[0]).lower()
-
-                        # 1. Direct Match: The executable IS the trigger
-                        if exe_name == trigger_lower:
-                            found_profile = profile
-                            trigger_app = exe_name
-                            break
-
-                        # 2. Wrapper Match: If exe is a wrapper, scan the rest of the tokens
-                        if exe_name in SAFE_WRAPPERS:
-                            # Scan remaining tokens (arguments)
-                            for token in tokens[1:]:
-                                token_base = os.path.basename(token).lower()
-
-                                if token_base == trigger_lower:
-                                    # FILTER: Ignore known Flatpak noise
-                                    if any(token.startswith(prefix) for prefix in IGNORE_PREFIXES):
-                                        continue
-
-                                    found_profile = profile
-                                    trigger_app = (full_args[:40] + '...') if len(full_args) > 40 else full_args
-                                    break
-                            if found_profile: break
-
-                    if found_profile: break
-                if found_profile: break
+            # Matching is pure lookups against the pre-normalized process list.
+            # Profile order decides priority: the earliest profile with a running trigger wins.
+            for pid, exe_name, wrapped_args in procs:
+                # 1. Direct Match: The executable IS a trigger
+                match = trigger_index.get(exe_name)
+                if match:
+                    if found_rank is None or match[0] < found_rank:
+                        found_rank, found_profile = match
+                        found_pid, found_exe = pid, exe_name
+                        trigger_app = exe_name
+
+                # 2. Wrapper Match: If exe is a wrapper, scan the rest of the tokens
+                # Checked even on a direct hit: a better-ranked trigger may sit in the arguments
+                if wrapped_args:
+                    for token, token_base in wrapped_args:
+                        match = trigger_index.get(token_base)
+                        if not match: continue
+
+                        # FILTER: Ignore known Flatpak noise
+                        if token.startswith(IGNORE_PREFIXES):
+                            continue
+
+                        if found_rank is None or match[0] < found_rank:
+                            found_rank, found_profile = match
+                            found_pid, found_exe = pid, exe_name
+                            full_args = " ".join([exe_name] + [t for t, _ in wrapped_args])
+                            trigger_app = (full_args[:40] + '...') if len(full_args) > 40 else full_args
+
+                # Nothing can outrank the first profile
+                if found_rank == 0: break
 
             if found_profile:
+                self.active_pid = found_pid
+                self.active_exe = found_exe
                 if self.active_profile_name != found_profile["name"] or self.current_state != "game":
                     self.log(f"\nMatch: Profile '{found_profile['name']}' (Trigger: {trigger_app})")
                     self.apply_game_profile(found_profile)
@@ -304,22 +532,22 @@ class LuxWatch(QSystemTrayIcon):
         connected = self.get_connected_monitors()
         settings = self.cfg_manager.get_desktop_settings()["monitors"]
 
+        levels = {}
         for mon in connected:
-            level = settings.get(mon, 70)
-            self.set_brightness(mon, level)
+            levels[mon] = settings.get(mon, 70)
+        self.set_brightness_bulk(levels)
 
         self.setToolTip(f"{APP_NAME}: Desktop\nStandard Brightness")
 
     def apply_game_profile(self, profile):
         connected = self.get_connected_monitors()
+        resolved = self.cfg_manager.get_monitor_levels(profile)
 
+        # Monitors the profile doesn't mention run at full brightness
+        levels = {}
         for mon in connected:
-            m_conf = profile["monitors"].get(mon, {"brightness": 100, "enabled": True})
-
-            if not m_conf.get("enabled", True):
-                self.set_brightness(mon, 0)
-            else:
-                self.set_brightness(mon, m_conf.get("brightness", 100))
+            levels[mon] = resolved.get(mon, 100)
+        self.set_brightness_bulk(levels)
 
         self.setToolTip(f"{APP_NAME}: Gaming\nProfile: {profile['name']}")
 
@@ -362,15 +590,20 @@ class SettingsWindow(QDialog):
 
         # RIGHT PANE
         self.right_widget = QWidget()
-        self.right_layout = QVBoxLayout()
-        self.right_widget.setLayout(self.right_layout)
+        self.right_container_layout = QVBoxLayout()
+        self.right_container_layout.setContentsMargins(0,0,0,0)
+        self.right_widget.setLayout(self.right_container_layout)
         splitter.addWidget(self.right_widget)
         splitter.setStretchFactor(1, 3)
 
+        self.right_inner = None
+        self.clear_right_pane()
+
         self.current_selection_index = -1
         self.monitor_inputs = {}
 
     def refresh_all(self):
+        self.main_app.invalidate_monitor_cache()
         self.profile_list.clear()
         self.profile_list.addItem("Default / Desktop")
 
@@ -397,20 +630,20 @@ class SettingsWindow(QDialog):
             confirm = QMessageBox.question(self, "Confirm", "Delete this profile?", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
             if confirm == QMessageBox.StandardButton.Yes:
                 self.main_app.cfg_manager.delete_profile(row - 1)
+                self.main_app.active_pid = None
                 self.refresh_all()
 
     def clear_right_pane(self):
-        while self.right_layout.count():
-            item = self.right_layout.takeAt(0)
-            widget = item.widget()
-            if widget: widget.deleteLater()
-            elif item.layout(): self.clear_nested_layout(item.layout())
-
-    def clear_nested_layout(self, layout):
-        while layout.count():
-            item = layout.takeAt(0)
-            if item.widget(): item.widget().deleteLater()
-            elif item.layout(): self.clear_nested_layout(item.layout())
+        # Swap in a fresh container; deleting the old one lets Qt tear down all its children at once
+        if self.right_inner is not None:
+            self.right_container_layout.removeWidget(self.right_inner)
+            self.right_inner.hide()
+            self.right_inner.deleteLater()
+
+        self.right_inner = QWidget()
+        self.right_layout = QVBoxLayout()
+        self.right_inner.setLayout(self.right_layout)
+        self.right_container_layout.addWidget(self.right_inner)
 
     def load_profile_details(self, row):
         self.clear_right_pane()
@@ -538,6 +771,7 @@ class SettingsWindow(QDialog):
             settings = self.main_app.cfg_manager.get_desktop_settings()
             for mon_id, spinbox in self.monitor_inputs.items():
                 settings["monitors"][mon_id] = spinbox.value()
+            self.main_app.cfg_manager.save_config()
             QMessageBox.information(self, "Saved", "Desktop defaults updated.")
             if self.main_app.current_state == "desktop":
                 self.main_app.apply_desktop_profile()
@@ -553,12 +787,14 @@ class SettingsWindow(QDialog):
                     "brightness": widgets["val"].value(),
                     "enabled": widgets["chk"].isChecked()
                 }
+            # Saving first refreshes the trigger index and resolved levels used below
+            self.main_app.cfg_manager.save_config()
             QMessageBox.information(self, "Saved", f"Profile '{profile['name']}' updated.")
+            # Triggers may have changed, so force a full rescan on the next tick
+            self.main_app.active_pid = None
             if self.main_app.active_profile_name == profile["name"]:
                 self.main_app.apply_game_profile(profile)
 
-        self.main_app.cfg_manager.save_config()
-
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--debug", action="store_true", help="Enable verbose logging")